@@ -9,9 +9,12 @@ import csv
 import io
 from datetime import datetime
 import json
+import re
 import math
+import bisect
 import threading
 import time
+from collections import deque
 
 # ============================================================================
 # POWER SYSTEM PHYSICS ENGINE
@@ -42,6 +45,11 @@ class PowerSystem:
         X1_ohm_km = 0.40
         self.z1_pu_km = complex(R1_ohm_km, X1_ohm_km) / self.Z_base
         
+        # Severity bins on fault current (A): strictly above a threshold
+        # promotes the fault to the next level
+        self.severity_thresholds = [3000, 5000, 8000]
+        self.severity_levels = ["INFO", "CAUTION", "WARNING", "CRITICAL"]
+        
         # IEEE 13 Node estimated line lengths (km)
         self.line_lengths = {
             '650-632': 2.0,
@@ -55,6 +63,24 @@ class PowerSystem:
             '684-652': 1.2,
             '633-634': 0.6
         }
+        
+        # Network tree paths (Bus 650 to each bus)
+        self.paths = {
+            '650': [],
+            '632': ['650-632'],
+            '633': ['650-632', '632-633'],
+            '634': ['650-632', '632-633', '633-634'],
+            '645': ['650-632', '632-645'],
+            '646': ['650-632', '632-645', '645-646'],
+            '671': ['650-632', '632-671'],
+            '680': ['650-632', '632-671', '671-680'],
+            '684': ['650-632', '632-671', '671-684'],
+            '611': ['650-632', '632-671', '671-684', '684-611'],
+            '652': ['650-632', '632-671', '671-684', '684-652']
+        }
+        
+        # Topology is static: precompute impedance from Bus 650 to every bus
+        self.Z_path = {bus: self._get_path_impedance(bus) for bus in self.paths}
     
     def calculate_fault_current(self, bus_name, fault_type='3LG'):
         """
@@ -67,55 +93,53 @@ class PowerSystem:
         Returns:
             dict with magnitude (A), severity, impedance
         """
-        # Get path impedance from substation to fault
-        Z_path = self._get_path_impedance(bus_name)
+        # Get path impedance from substation to fault (unknown bus -> at source)
+        Z_path = self.Z_path.get(bus_name, complex(0, 0))
+        return self._fault_current_from_path(Z_path, fault_type)
+    
+    def calculate_fault_currents(self, fault_type='3LG'):
+        """
+        Calculate fault current at every bus in one sweep
+        
+        Args:
+            fault_type: '3LG', 'SLG', 'LL', 'LLG'
+        
+        Returns:
+            dict of bus -> result (same fields as calculate_fault_current)
+        """
+        return {
+            bus: self._fault_current_from_path(Z_path, fault_type)
+            for bus, Z_path in self.Z_path.items()
+        }
+    
+    def _fault_current_from_path(self, Z_path, fault_type):
+        """Fault current result for a precomputed path impedance"""
         Z_total = self.Z_source + Z_path
+        Z_total_mag = abs(Z_total)  # one sqrt, reused below
         
         # Fault current in per-unit
-        if abs(Z_total) < 1e-6:
+        if Z_total_mag < 1e-6:
             I_fault_pu = 0
         else:
-            I_fault_pu = 1.0 / abs(Z_total)
+            I_fault_pu = 1.0 / Z_total_mag
         
         # Convert to actual amperes
         I_fault_A = I_fault_pu * self.I_base
         
-        # Determine severity
-        if I_fault_A > 8000:
-            severity = "CRITICAL"
-        elif I_fault_A > 5000:
-            severity = "WARNING"
-        elif I_fault_A > 3000:
-            severity = "CAUTION"
-        else:
-            severity = "INFO"
+        # Determine severity (index = number of thresholds exceeded)
+        severity = self.severity_levels[bisect.bisect_left(self.severity_thresholds, I_fault_A)]
         
         return {
             'magnitude': round(I_fault_A, 2),
             'severity': severity,
-            'impedance_pu': round(abs(Z_total), 4),
+            'impedance_pu': round(Z_total_mag, 4),
             'type': fault_type,
             'voltage_drop_pct': round((I_fault_pu * abs(Z_path)) * 100, 2)
         }
     
     def _get_path_impedance(self, bus_name):
         """Calculate total impedance from Bus 650 to target bus"""
-        # Network tree paths
-        paths = {
-            '650': [],
-            '632': ['650-632'],
-            '633': ['650-632', '632-633'],
-            '634': ['650-632', '632-633', '633-634'],
-            '645': ['650-632', '632-645'],
-            '646': ['650-632', '632-645', '645-646'],
-            '671': ['650-632', '632-671'],
-            '680': ['650-632', '632-671', '671-680'],
-            '684': ['650-632', '632-671', '671-684'],
-            '611': ['650-632', '632-671', '671-684', '684-611'],
-            '652': ['650-632', '632-671', '671-684', '684-652']
-        }
-        
-        path = paths.get(bus_name, [])
+        path = self.paths.get(bus_name, [])
         Z_total = complex(0, 0)
         
         for segment in path:
@@ -166,30 +190,64 @@ class MapManager:
             ['684', '611'],
             ['684', '652']
         ]
-    
-    def get_topology(self):
-        """Return complete topology for frontend"""
-        return {
+        
+        # Topology is static; build the frontend payload once (read-only)
+        self._topology_cached = {
             'nodes': self.nodes,
             'connections': self.connections
         }
+    
+    def get_topology(self):
+        """Return complete topology for frontend"""
+        return self._topology_cached
 
 
 # ============================================================================
 # GOOGLE SHEETS DATA CONNECTOR
 # ============================================================================
 
+# Fault type -> severity keywords (one scan per row instead of two)
+_CRIT_RE = re.compile(r'LLG|Phase B-C')
+_WARN_RE = re.compile(r'SLG|Phase A')
+
 class DataConnector:
     """
     Fetches live fault data from Google Sheets
-    Silently refreshes every 1 second
+    Silently refreshes every 1 second on a background thread
     """
     
-    def __init__(self, sheet_id, sheet_name):
+    def __init__(self, sheet_id, sheet_name, refresh_interval=1.0, on_update=None, on_health=None):
         self.sheet_id = sheet_id
         self.sheet_name = sheet_name
+        self.refresh_interval = refresh_interval
+        self._on_update = on_update  # called with each fresh fault list
+        self._on_health = on_health  # called with fetch_ok when fetching fails or recovers
         self.cache = []
+        self.severity_counts = {'CRITICAL': 0, 'WARNING': 0, 'INFO': 0}
         self.last_fetch = None
+        self.fetch_ok = True
+        
+        # Keep-alive session: reuses the TLS connection between polls
+        self._session = requests.Session()
+        self._lock = threading.Lock()
+        self._thread = None
+    
+    def start(self):
+        """Start background refreshing; call once the owner has finished wiring"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._refresh_loop, daemon=True)
+            self._thread.start()
+    
+    def _refresh_loop(self):
+        """Poll the sheet forever so callers never block on the network"""
+        while True:
+            self.fetch_data()
+            time.sleep(self.refresh_interval)
+    
+    def get_cached(self):
+        """Return (faults, severity_counts, last_fetch) from the last successful fetch"""
+        with self._lock:
+            return self.cache, self.severity_counts, self.last_fetch
     
     def fetch_data(self):
         """
@@ -208,13 +266,22 @@ class DataConnector:
         url = f"https://docs.google.com/spreadsheets/d/{self.sheet_id}/gviz/tq?tqx=out:csv&sheet={self.sheet_name}"
         
         try:
-            response = requests.get(url, timeout=3)
+            response = self._session.get(url, timeout=3)
             response.raise_for_status()
             
             reader = csv.DictReader(io.StringIO(response.text))
             data = []
+            counts = {'CRITICAL': 0, 'WARNING': 0, 'INFO': 0}
             
-            for row in reader:
+            # Fallback date/time and fetch timestamp are the same for every
+            # row, so format them once per fetch instead of per row
+            now = datetime.now()
+            default_date = now.strftime('%Y-%m-%d')
+            default_time = now.strftime('%H:%M:%S')
+            fetch_timestamp = now.isoformat()
+            seen_ids = set()
+            
+            for index, row in enumerate(reader):
                 try:
                     # Parse columns correctly
                     report_id = row.get('ReportID', 'UNKNOWN').strip()
@@ -224,12 +291,20 @@ class DataConnector:
                     y_coord = float(row.get('Long(y)', 0))  # This is Y on the map
                     
                     fault_type = row.get('Fault Type', '').strip()
-                    status = row.get('Status', '').strip().upper() if row.get('Status') else 'ACTIVE FAULT'
+                    raw_status = row.get('Status')
+                    status = raw_status.strip().upper() if raw_status else 'ACTIVE FAULT'
+                    
+                    # Unique key per row: blank or repeated ReportIDs fall back to
+                    # the row index so every row still gets its own marker
+                    key = report_id
+                    if not key or key in seen_ids:
+                        key = f'{report_id}#{index}'
                     
                     fault = {
                         'id': report_id,
-                        'date': row.get('Date', datetime.now().strftime('%Y-%m-%d')),
-                        'time': row.get('Time', datetime.now().strftime('%H:%M:%S')),
+                        'key': key,
+                        'date': row.get('Date', default_date),
+                        'time': row.get('Time', default_time),
                         'device': 'SimDev',  # Default device name
                         'x': x_coord,  # Map X coordinate
                         'y': y_coord,  # Map Y coordinate
@@ -237,13 +312,13 @@ class DataConnector:
                         'fault_type': fault_type,
                         'status': status if status else 'ACTIVE FAULT',
                         'modified_by': row.get('Modified By', '').strip(),
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': fetch_timestamp
                     }
                     
                     # Determine severity from fault type
-                    if 'LLG' in fault_type or 'Phase B-C' in fault_type:
+                    if _CRIT_RE.search(fault_type):
                         fault['severity'] = 'CRITICAL'
-                    elif 'SLG' in fault_type or 'Phase A' in fault_type:
+                    elif _WARN_RE.search(fault_type):
                         fault['severity'] = 'WARNING'
                     else:
                         fault['severity'] = 'INFO'
@@ -256,19 +331,47 @@ class DataConnector:
                         pass
                     
                     data.append(fault)
+                    seen_ids.add(key)
+                    counts[fault['severity']] += 1
                     
                 except (ValueError, KeyError) as e:
                     print(f"⚠ Row parse error: {e}")
                     print(f"   Row data: {row}")
                     continue
             
-            self.cache = data
-            self.last_fetch = datetime.now()
-            return data
+            with self._lock:
+                self.cache = data
+                self.severity_counts = counts
+                self.last_fetch = datetime.now()
+                recovered = not self.fetch_ok
+                self.fetch_ok = True
             
         except Exception as e:
             print(f"⚠ Fetch error: {e}")
+            with self._lock:
+                failed = self.fetch_ok
+                self.fetch_ok = False
+            if failed:
+                self._report_health(False)
             return self.cache
+        
+        # Kept out of the fetch try: a push failure is not a fetch failure
+        if self._on_update:
+            try:
+                self._on_update(data)
+            except Exception as e:
+                print(f"⚠ Update callback error: {e}")
+        if recovered:
+            self._report_health(True)
+        return data
+    
+    def _report_health(self, fetch_ok):
+        """Tell the owner the sheet fetch just failed or recovered"""
+        if self._on_health:
+            try:
+                self._on_health(fetch_ok)
+            except Exception as e:
+                print(f"⚠ Health callback error: {e}")
 
 # ============================================================================
 # PYWEBVIEW API BRIDGE
@@ -283,19 +386,154 @@ class Api:
     def __init__(self):
         self.power_system = PowerSystem()
         self.map_manager = MapManager()
+        
+        # Server push state: faults last sent to the frontend (by row key) and a
+        # version bumped on every change so the JS side can order deltas
+        self.fault_version = 0
+        self._published = {}
+        self._push_callback = None
+        self._push_lock = threading.Lock()
+        self._history = deque(maxlen=64)  # recent deltas for get_faults_since
+        
         self.data_connector = DataConnector(
             sheet_id="1UTQUNv0z8m293VNw5tuJzkcxGnbNuV4zUYSV0MsrOQw",
-            sheet_name="inputLog"
+            sheet_name="inputLog",
+            on_update=self._publish_faults,
+            on_health=self._publish_status
         )
         self.auto_refresh = True
+        
+        # Only now can _publish_faults reach self.data_connector safely
+        self.data_connector.start()
+    
+    def subscribe(self, callback='onFaultDelta', since=None):
+        """
+        Start pushing fault deltas to window.<callback> in the frontend
+        
+        Args:
+            callback: Global JS function name receiving each delta
+            since: Version the frontend already holds (None for a fresh start)
+        
+        Returns:
+            get_faults_since(since); every later push is
+            {'version', 'added', 'removed', 'status'} relative to it, so the
+            frontend never polls get_system_status
+        """
+        if not callback.isidentifier():
+            raise ValueError(f"Invalid callback name: {callback}")
+        
+        with self._push_lock:
+            self._push_callback = callback
+            return self._faults_since(since)
+    
+    def get_faults_since(self, version):
+        """
+        Return only what changed after the given fault version
+        
+        Called by the frontend to catch up when a pushed delta went missing
+        (its version skipped ahead); resume after hiding uses subscribe(since)
+        
+        Returns:
+            {'version', 'added', 'removed', 'status'} composed from recent
+            deltas, or a full {'version', 'faults', 'status'} snapshot when
+            the version is unknown or older than the retained history
+        """
+        with self._push_lock:
+            return self._faults_since(version)
+    
+    def _faults_since(self, version):
+        """Build the get_faults_since payload (caller holds _push_lock)"""
+        status = self.get_system_status()
+        
+        covered = version == self.fault_version or (
+            self._history and version is not None and
+            self._history[0]['version'] <= version + 1 <= self.fault_version)
+        if not covered:
+            return {
+                'version': self.fault_version,
+                'faults': list(self._published.values()),
+                'status': status
+            }
+        
+        # Fold the newer deltas: last write per id wins
+        added, removed = {}, set()
+        for delta in self._history:
+            if delta['version'] <= version:
+                continue
+            for fid in delta['removed']:
+                added.pop(fid, None)
+                removed.add(fid)
+            for fault in delta['added']:
+                added[fault['key']] = fault
+                removed.discard(fault['key'])
+        
+        return {
+            'version': self.fault_version,
+            'added': list(added.values()),
+            'removed': list(removed),
+            'status': status
+        }
+    
+    def unsubscribe(self):
+        """Stop pushing fault deltas (frontend hidden); resume with subscribe"""
+        with self._push_lock:
+            self._push_callback = None
+    
+    def _publish_faults(self, faults):
+        """Diff a fresh fetch against what the frontend has and push the delta"""
+        current = {f['key']: f for f in faults}
+        
+        with self._push_lock:
+            added = [f for fid, f in current.items()
+                     if self._fault_changed(self._published.get(fid), f)]
+            removed = [fid for fid in self._published if fid not in current]
+            if not added and not removed:
+                return
+            
+            self._published = current
+            self.fault_version += 1
+            delta = {
+                'version': self.fault_version,
+                'added': added,
+                'removed': removed,
+                'status': self.get_system_status()
+            }
+            self._history.append(delta)
+            callback = self._push_callback
+        
+        self._push(callback, delta)
+    
+    def _publish_status(self, fetch_ok):
+        """Push a status-only update (no version) when fetching fails or recovers"""
+        with self._push_lock:
+            callback = self._push_callback
+        
+        self._push(callback, {'status': self.get_system_status()})
+    
+    @staticmethod
+    def _push(callback, payload):
+        """Hand a payload to window.<callback> in the frontend, if subscribed"""
+        if callback and webview.windows:
+            try:
+                webview.windows[0].evaluate_js(f"window.{callback}({json.dumps(payload)})")
+            except Exception as e:
+                print(f"⚠ Push error: {e}")
+    
+    @staticmethod
+    def _fault_changed(old, new):
+        """True if a fault is new or differs (ignoring the per-fetch timestamp)"""
+        if old is None:
+            return True
+        return any(old.get(k) != v for k, v in new.items() if k != 'timestamp')
     
     def get_topology(self):
         """Return IEEE 13 node topology"""
         return self.map_manager.get_topology()
     
     def get_faults(self):
-        """Fetch current fault data (called repeatedly by frontend)"""
-        return self.data_connector.fetch_data()
+        """Return latest fault data (full list; the frontend uses subscribe)"""
+        faults, _, _ = self.data_connector.get_cached()
+        return faults
     
     def simulate_fault(self, bus_name, fault_type='3LG'):
         """
@@ -328,18 +566,17 @@ class Api:
     
     def get_system_status(self):
         """Return overall system health metrics"""
-        faults = self.data_connector.cache
-        
-        critical = sum(1 for f in faults if f.get('severity') == 'CRITICAL')
-        warnings = sum(1 for f in faults if f.get('severity') == 'WARNING')
+        # Severity counts are tallied once per fetch, not per status call
+        faults, counts, last_fetch = self.data_connector.get_cached()
         
         return {
             'total_faults': len(faults),
-            'critical': critical,
-            'warnings': warnings,
+            'critical': counts['CRITICAL'],
+            'warnings': counts['WARNING'],
             'system_voltage': 13.2,
             'frequency': 60.0,
-            'last_update': self.data_connector.last_fetch.isoformat() if self.data_connector.last_fetch else None,
+            'last_update': last_fetch.isoformat() if last_fetch else None,
+            'feed_ok': self.data_connector.fetch_ok,
             'timestamp': datetime.now().isoformat()
         }
     
@@ -357,8 +594,11 @@ HTML = """<!DOCTYPE html>
 <head>
     <meta charset="UTF-8">
     <title>TACTICAL SCADA - IEEE 13 Node</title>
+    <link rel="preconnect" href="https://cdn.jsdelivr.net">
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
     <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet@1.9.4/dist/leaflet.css">
-    <script src="https://cdn.jsdelivr.net/npm/leaflet@1.9.4/dist/leaflet.js"></script>
+    <script src="https://cdn.jsdelivr.net/npm/leaflet@1.9.4/dist/leaflet.js" defer></script>
     <link href="https://fonts.googleapis.com/css2?family=Share+Tech+Mono&display=swap" rel="stylesheet">
     <style>
         * {
@@ -393,21 +633,15 @@ HTML = """<!DOCTYPE html>
             left: 0;
             width: 100%;
             height: 100%;
+            /* Static: animating a full-viewport layer re-composites every frame */
             background: repeating-linear-gradient(
                 0deg,
-                rgba(0, 0, 0, 0.1),
-                rgba(0, 0, 0, 0.1) 1px,
-                transparent 1px,
-                transparent 3px
+                rgba(0, 0, 0, 0.1) 0 1px,
+                transparent 1px 3px
             );
             pointer-events: none;
             z-index: 1000;
-            animation: scanline 10s linear infinite;
-        }
-        
-        @keyframes scanline {
-            0% { transform: translateY(0); }
-            100% { transform: translateY(100px); }
+            transform: translateZ(0);
         }
         
         /* ===== VIGNETTE EFFECT ===== */
@@ -603,6 +837,18 @@ HTML = """<!DOCTYPE html>
             flex: 1;
             overflow-y: auto;
             padding: 15px;
+        }
+        
+        /* Virtualized feed: spacer holds full height, window holds visible items */
+        .feed-spacer {
+            position: relative;
+        }
+        
+        .feed-window {
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
             display: flex;
             flex-direction: column;
             gap: 10px;
@@ -649,6 +895,12 @@ HTML = """<!DOCTYPE html>
             font-family: monospace;
         }
         
+        .feed-item-time {
+            color: #666;
+            margin-top: 5px;
+            font-size: 10px;
+        }
+        
         /* ===== SIMULATION PANEL ===== */
         .sim-panel {
             padding: 20px;
@@ -727,6 +979,30 @@ HTML = """<!DOCTYPE html>
             font-family: monospace;
         }
         
+        /* ===== FAULT MARKERS ===== */
+        .fault-marker {
+            width: 24px;
+            height: 24px;
+            border: 3px solid #fff;
+            border-radius: 50%;
+            animation: pulse 1.5s ease-in-out infinite;
+        }
+        
+        @keyframes pulse {
+            0%, 100% { transform: scale(1); opacity: 1; }
+            50% { transform: scale(1.3); opacity: 0.7; }
+        }
+        
+        /* Fixed overlays: keep their internal updates out of page-wide layout */
+        .side-panel, .status-bar, .live-feed {
+            contain: layout paint style;
+        }
+        
+        /* No paint containment here: the title's pulse-glow spills past the bar */
+        .hud-top {
+            contain: layout style;
+        }
+        
         /* ===== CUSTOM LEAFLET STYLES ===== */
         .leaflet-container {
             background: transparent !important;
@@ -746,6 +1022,34 @@ HTML = """<!DOCTYPE html>
             border: 2px solid #66fcf1;
         }
         
+        .popup {
+            padding: 10px;
+        }
+        
+        .popup-title {
+            font-size: 14px;
+            font-weight: bold;
+            margin-bottom: 8px;
+            color: var(--sev-color, inherit);
+        }
+        
+        .popup-body {
+            line-height: 1.8;
+        }
+        
+        .popup-nominal {
+            color: #00ff41;
+        }
+        
+        .popup-coord {
+            color: #666;
+            margin-top: 5px;
+        }
+        
+        .popup-coord.fault {
+            color: #00ff41;
+        }
+        
         /* ===== SCROLLBAR ===== */
         .live-feed::-webkit-scrollbar {
             width: 8px;
@@ -801,12 +1105,83 @@ HTML = """<!DOCTYPE html>
     <div class="side-panel">
         <div class="panel-header">📡 LIVE FEED</div>
         <div class="live-feed" id="live-feed">
-            <div class="feed-item">
-                <div class="feed-item-id">SYSTEM INITIALIZED</div>
-                <div>Awaiting fault data...</div>
+            <div class="feed-spacer" id="feed-spacer">
+                <div class="feed-window" id="feed-window"></div>
             </div>
         </div>
         
+        <!-- FEED ITEM TEMPLATES (cloned and filled via textContent) -->
+        <template id="system-feed-tpl">
+            <div class="feed-item">
+                <div class="feed-item-id"></div>
+                <div class="feed-msg"></div>
+            </div>
+        </template>
+        <template id="feed-tpl">
+            <div class="feed-item">
+                <div class="feed-item-id"></div>
+                <div>Severity: <span class="feed-sev"></span></div>
+                <div>Device: <span class="feed-device"></span></div>
+                <div class="feed-item-coord"></div>
+                <div>Distance: <span class="feed-distance"></span> m</div>
+                <div>Status: <span class="feed-status"></span></div>
+                <div class="feed-item-time"></div>
+            </div>
+        </template>
+        <template id="sim-feed-tpl">
+            <div class="feed-item">
+                <div class="feed-item-id"></div>
+                <div>Severity: <span class="feed-sev"></span></div>
+                <div>Bus: <span class="feed-device"></span></div>
+                <div>Fault Type: <span class="feed-fault-type"></span></div>
+                <div>Current: <span class="feed-current"></span> A</div>
+                <div>Impedance: <span class="feed-impedance"></span> PU</div>
+                <div>Voltage Drop: <span class="feed-vdrop"></span>%</div>
+                <div class="feed-item-coord"></div>
+                <div class="feed-item-time"></div>
+            </div>
+        </template>
+        
+        <!-- MAP POPUP TEMPLATES -->
+        <template id="node-popup-tpl">
+            <div class="popup">
+                <div class="popup-title"></div>
+                <div class="popup-body">
+                    <div>Name: <span class="pop-name"></span></div>
+                    <div>Type: <span class="pop-type"></span></div>
+                    <div>Voltage: <span class="pop-voltage"></span> kV</div>
+                    <div class="popup-nominal">Status: NOMINAL</div>
+                    <div class="popup-coord"></div>
+                </div>
+            </div>
+        </template>
+        <template id="fault-popup-tpl">
+            <div class="popup">
+                <div class="popup-title"></div>
+                <div class="popup-body">
+                    <div>ID: <span class="pop-id"></span></div>
+                    <div>Device: <span class="pop-device"></span></div>
+                    <div>Distance: <span class="pop-distance"></span> m</div>
+                    <div>Status: <span class="pop-status"></span></div>
+                    <div>Time: <span class="pop-time"></span></div>
+                    <div class="popup-coord fault"></div>
+                </div>
+            </div>
+        </template>
+        <template id="sim-popup-tpl">
+            <div class="popup">
+                <div class="popup-title"></div>
+                <div class="popup-body">
+                    <div>ID: <span class="pop-id"></span></div>
+                    <div>Bus: <span class="pop-device"></span></div>
+                    <div>Type: <span class="pop-fault-type"></span></div>
+                    <div>Current: <span class="pop-current"></span> A</div>
+                    <div>Impedance: <span class="pop-impedance"></span> PU</div>
+                    <div>V-Drop: <span class="pop-vdrop"></span>%</div>
+                </div>
+            </div>
+        </template>
+        
         <!-- SIMULATION PANEL -->
         <div class="sim-panel">
             <h3>🎮 FAULT SIMULATOR</h3>
@@ -834,9 +1209,59 @@ HTML = """<!DOCTYPE html>
     </div>
 
     <script>
-        let map, markers = [], lines = [], topology = null;
+        // Theme lookups (severity / bus type -> marker color)
+        const DEFAULT_COLOR = '#66fcf1';
+        const SEV_COLOR = Object.freeze({
+            CRITICAL: '#ff4d4d',
+            WARNING: '#ffa500',
+            CAUTION: '#ffff00'
+        });
+        const TYPE_COLOR = Object.freeze({
+            substation: '#00ff41',
+            transformer: '#ffa500',
+            load: '#ff4d4d'
+        });
+        
+        let map, topoGroup = null, topology = null;
+        let renderer = null;    // shared canvas for static topology shapes
+        let faultLayer = null;  // all fault markers
+        const faultMarkerById = new Map();  // fault key -> live marker
+        const simMarkerById = new Map();    // sim id -> {marker, removal timer}
+        const SIM_MARKER_MS = 10000;        // how long a simulated fault stays on the map
         let faultData = [];
-        let updateInterval = null;
+        const faultStore = new Map();  // row key -> fault, kept in sync by pushes
+        let faultVersion = -1;         // -1 until the first snapshot arrives
+        let pendingDeltas = [];
+        let resumeVersion = null;  // version held when the window was hidden
+        let pushActive = false;    // Python currently pushing to onFaultDelta
+        let syncChain = Promise.resolve();
+        let resyncPending = false;
+        const SUBSCRIBE_RETRY_MIN_MS = 1000;
+        const SUBSCRIBE_RETRY_MAX_MS = 30000;
+        let subscribeRetryMs = SUBSCRIBE_RETRY_MIN_MS;
+        const seenFaultIds = new Set();  // fault keys currently shown in the live feed
+        const feedTpl = document.getElementById('feed-tpl');
+        const simFeedTpl = document.getElementById('sim-feed-tpl');
+        const systemFeedTpl = document.getElementById('system-feed-tpl');
+        const nodePopupTpl = document.getElementById('node-popup-tpl');
+        const faultPopupTpl = document.getElementById('fault-popup-tpl');
+        const simPopupTpl = document.getElementById('sim-popup-tpl');
+        
+        // Live feed is windowed: feedData holds every entry (newest first),
+        // only those near the viewport get DOM nodes
+        const FEED_MAX = 50;
+        const FEED_GAP = 10;           // matches .feed-window gap
+        const FEED_EST_HEIGHT = 150;   // until an item kind has been measured
+        const FEED_OVERSCAN = 300;     // px rendered beyond the viewport
+        const feedEl = document.getElementById('live-feed');
+        const feedSpacer = document.getElementById('feed-spacer');
+        const feedWindow = document.getElementById('feed-window');
+        const feedItemHeight = new Map();  // template -> measured height
+        let feedData = [{
+            tpl: systemFeedTpl,
+            fields: {'feed-item-id': 'SYSTEM INITIALIZED', 'feed-msg': 'Awaiting fault data...'}
+        }];
+        let feedRenderPending = false;
         
 // ===== INITIALIZE MAP WITH SIMPLE CRS =====
         function initMap() {
@@ -853,11 +1278,24 @@ HTML = """<!DOCTYPE html>
             const bounds = [[-2000, -2500], [6000, 2500]];
             map.fitBounds(bounds);
             
-            // Track cursor coordinates
+            // Topology lines and nodes paint into one canvas instead of one
+            // DOM element each; fault markers stay divIcons for the pulse
+            renderer = L.canvas({padding: 0.5});
+            faultLayer = L.layerGroup().addTo(map);
+            
+            // Track cursor coordinates (at most one text write per frame)
+            const cursorEl = document.getElementById('cursor-coord');
+            let pendingCoord = null;
             map.on('mousemove', function(e) {
-                const coord = e.latlng;
-                document.getElementById('cursor-coord').textContent = 
-                    `X: ${Math.round(coord.lng)}, Y: ${Math.round(coord.lat)}`;
+                const rafPending = pendingCoord !== null;
+                pendingCoord = e.latlng;
+                if (rafPending) return;
+                
+                requestAnimationFrame(() => {
+                    cursorEl.textContent = 
+                        `X: ${Math.round(pendingCoord.lng)}, Y: ${Math.round(pendingCoord.lat)}`;
+                    pendingCoord = null;
+                });
             });
             
             console.log('✓ Map initialized with Simple CRS');
@@ -868,6 +1306,9 @@ HTML = """<!DOCTYPE html>
             try {
                 topology = await window.pywebview.api.get_topology();
                 
+                // Build the whole network off-map, attach it once at the end
+                topoGroup = L.featureGroup();
+                
                 // Draw connections (lines)
                 topology.connections.forEach(([busA, busB]) => {
                     const nodeA = topology.nodes[busA];
@@ -879,57 +1320,42 @@ HTML = """<!DOCTYPE html>
                             {
                                 color: '#66fcf1',
                                 weight: 3,
-                                opacity: 0.6
+                                opacity: 0.6,
+                                renderer: renderer
                             }
-                        ).addTo(map);
+                        );
                         
-                        lines.push(line);
+                        topoGroup.addLayer(line);
                     }
                 });
                 
                 // Draw nodes (markers)
                 Object.entries(topology.nodes).forEach(([busId, node]) => {
-                    const iconColor = node.type === 'substation' ? '#00ff41' : 
-                                     node.type === 'transformer' ? '#ffa500' :
-                                     node.type === 'load' ? '#ff4d4d' : '#66fcf1';
+                    const iconColor = TYPE_COLOR[node.type] || DEFAULT_COLOR;
                     
-                    const icon = L.divIcon({
-                        html: `<div style="
-                            width: 16px;
-                            height: 16px;
-                            background: ${iconColor};
-                            border: 2px solid #fff;
-                            border-radius: 50%;
-                            box-shadow: 0 0 15px ${iconColor};
-                        "></div>`,
-                        className: '',
-                        iconSize: [16, 16],
-                        iconAnchor: [8, 8]
+                    const marker = L.circleMarker([node.y, node.x], {
+                        radius: 8,
+                        fillColor: iconColor,
+                        fillOpacity: 1,
+                        color: '#fff',
+                        weight: 2,
+                        renderer: renderer
                     });
                     
-                    const marker = L.marker([node.y, node.x], {icon: icon}).addTo(map);
-                    
                     // Tooltip on hover
-                    marker.bindPopup(`
-                        <div style="padding: 10px;">
-                            <div style="font-size: 14px; font-weight: bold; margin-bottom: 8px;">
-                                BUS ${busId}
-                            </div>
-                            <div style="line-height: 1.8;">
-                                <div>Name: ${node.name}</div>
-                                <div>Type: ${node.type.toUpperCase()}</div>
-                                <div>Voltage: ${node.voltage} kV</div>
-                                <div style="color: #00ff41;">Status: NOMINAL</div>
-                                <div style="color: #666; margin-top: 5px;">
-                                    Coord: (${node.x}, ${node.y})
-                                </div>
-                            </div>
-                        </div>
-                    `);
+                    marker.bindPopup(fillTemplate(nodePopupTpl, {
+                        'popup-title': `BUS ${busId}`,
+                        'pop-name': node.name,
+                        'pop-type': node.type.toUpperCase(),
+                        'pop-voltage': node.voltage,
+                        'popup-coord': `Coord: (${node.x}, ${node.y})`
+                    }));
                     
-                    markers.push(marker);
+                    topoGroup.addLayer(marker);
                 });
                 
+                topoGroup.addTo(map);
+                
                 console.log('✓ Topology drawn: ' + Object.keys(topology.nodes).length + ' nodes');
                 
             } catch (error) {
@@ -937,126 +1363,361 @@ HTML = """<!DOCTYPE html>
             }
         }
         
-        // ===== UPDATE FAULT DATA (REAL-TIME) =====
-        async function updateFaults() {
+        // ===== FAULT DELTAS PUSHED FROM PYTHON =====
+        window.onFaultDelta = function(delta) {
+            // Status-only push: the sheet fetch just failed or recovered
+            if (delta.version === undefined) {
+                updateStatus(delta.status);
+                return;
+            }
+            
+            // Pushes can race the initial snapshot; hold them until it lands
+            if (faultVersion < 0) {
+                pendingDeltas.push(delta);
+                return;
+            }
+            applyFaultDelta(delta);
+        };
+        
+        async function subscribeFaults(since = null) {
             try {
-                const newFaults = await window.pywebview.api.get_faults();
+                // Python answers with a full snapshot, or just the delta since `since`
+                const update = await window.pywebview.api.subscribe('onFaultDelta', since);
                 
-                // Update fault markers
-                // Remove old fault markers (keep topology markers)
-                markers.forEach(m => {
-                    if (m.options && m.options.isFault) {
-                        map.removeLayer(m);
-                    }
-                });
-                markers = markers.filter(m => !m.options || !m.options.isFault);
+                if (!update.faults) faultVersion = since;
+                applyCatchUp(update);
+                pushActive = true;
+                subscribeRetryMs = SUBSCRIBE_RETRY_MIN_MS;
                 
-                // Add new fault markers
-                newFaults.forEach(fault => {
-                    const color = fault.severity === 'CRITICAL' ? '#ff4d4d' :
-                                 fault.severity === 'WARNING' ? '#ffa500' :
-                                 fault.severity === 'CAUTION' ? '#ffff00' : '#66fcf1';
-                    
-                    const icon = L.divIcon({
-                        html: `<div style="
-                            width: 24px;
-                            height: 24px;
-                            background: ${color};
-                            border: 3px solid #fff;
-                            border-radius: 50%;
-                            box-shadow: 0 0 20px ${color};
-                            animation: pulse 1.5s ease-in-out infinite;
-                        "></div>
-                        <style>
-                            @keyframes pulse {
-                                0%, 100% { transform: scale(1); opacity: 1; }
-                                50% { transform: scale(1.3); opacity: 0.7; }
-                            }
-                        </style>`,
-                        className: '',
-                        iconSize: [24, 24],
-                        iconAnchor: [12, 12]
-                    });
-                    
-                    const marker = L.marker([fault.y, fault.x], {
-                        icon: icon,
-                        isFault: true
-                    }).addTo(map);
-                    
-                    marker.bindPopup(`
-                        <div style="padding: 10px;">
-                            <div style="font-size: 14px; font-weight: bold; margin-bottom: 8px; color: ${color};">
-                                ${fault.severity} FAULT
-                            </div>
-                            <div style="line-height: 1.8;">
-                                <div>ID: ${fault.id}</div>
-                                <div>Device: ${fault.device}</div>
-                                <div>Distance: ${fault.distance} m</div>
-                                <div>Status: ${fault.status}</div>
-                                <div>Time: ${fault.time}</div>
-                                <div style="color: #00ff41; margin-top: 5px;">
-                                    Coord: (${Math.round(fault.x)}, ${Math.round(fault.y)})
-                                </div>
-                            </div>
-                        </div>
-                    `);
-                    
-                    markers.push(marker);
+            } catch (error) {
+                console.error('❌ Fault subscribe error:', error);
+                
+                // Anything buffered predates the retry's snapshot, which supersedes it
+                pendingDeltas.length = 0;
+                setTimeout(syncSubscription, subscribeRetryMs);
+                subscribeRetryMs = Math.min(subscribeRetryMs * 2, SUBSCRIBE_RETRY_MAX_MS);
+            }
+        }
+        
+        // ===== PAUSE PUSHES WHILE HIDDEN =====
+        // pywebview serves each bridge call on its own thread, so subscribe and
+        // unsubscribe are issued strictly one after another; otherwise a late
+        // unsubscribe could undo a newer subscribe
+        function queueSync(task) {
+            syncChain = syncChain.then(task).catch(error => {
+                console.error('❌ Fault sync error:', error);
+            });
+            return syncChain;
+        }
+        
+        function syncSubscription() {
+            return queueSync(async () => {
+                // Act on visibility when this turn comes up, not when it was queued
+                if (document.hidden && pushActive) {
+                    // Buffer anything still in flight; the resume update supersedes it
+                    pushActive = false;
+                    resumeVersion = faultVersion;
+                    faultVersion = -1;
+                    await window.pywebview.api.unsubscribe();
+                } else if (!document.hidden && !pushActive) {
+                    // Catch up on only what changed while hidden, then pushes continue
+                    await subscribeFaults(resumeVersion);
+                }
+            });
+        }
+        
+        function applyFaultDelta(delta) {
+            // Already covered by the snapshot (or an earlier push)
+            if (delta.version <= faultVersion) return;
+            
+            // A push was lost (evaluate_js failed); hold this one and catch up first
+            if (delta.version !== faultVersion + 1) {
+                pendingDeltas.push(delta);
+                resyncFaults();
+                return;
+            }
+            
+            mergeFaultDelta(delta);
+        }
+        
+        function mergeFaultDelta(delta) {
+            delta.removed.forEach(id => faultStore.delete(id));
+            delta.added.forEach(fault => faultStore.set(fault.key, fault));
+            faultVersion = delta.version;
+            
+            renderFaults(delta.added, delta.status);
+        }
+        
+        // Apply a subscribe/get_faults_since answer: full snapshot or one folded delta
+        function applyCatchUp(update) {
+            if (update.faults) {
+                faultStore.clear();
+                update.faults.forEach(fault => faultStore.set(fault.key, fault));
+                faultVersion = update.version;
+                renderFaults(update.faults, update.status);
+            } else if (update.version > faultVersion) {
+                mergeFaultDelta(update);
+            }
+            
+            pendingDeltas.splice(0).forEach(applyFaultDelta);
+        }
+        
+        function resyncFaults() {
+            if (resyncPending) return;
+            resyncPending = true;
+            
+            // Same chain as subscribe/unsubscribe, so it never overlaps a visibility change
+            queueSync(async () => {
+                if (!pushActive) {
+                    resyncPending = false;
+                    return;  // hidden; the resume catch-up covers the gap
+                }
+                
+                let update;
+                try {
+                    update = await window.pywebview.api.get_faults_since(faultVersion);
+                } finally {
+                    // Pushes during the call stay buffered; cleared before draining
+                    // so a further gap can queue its own resync
+                    resyncPending = false;
+                }
+                applyCatchUp(update);
+            });
+        }
+        
+        // ===== UPDATE FAULT DATA (ON CHANGE) =====
+        // One formatter for every status tick (toLocaleTimeString builds a new one per call)
+        const TIME_FMT = new Intl.DateTimeFormat(undefined, {
+            hour: '2-digit', minute: '2-digit', second: '2-digit', hour12: false
+        });
+        const faultCountEl = document.getElementById('fault-count');
+        const lastUpdateEl = document.getElementById('last-update');
+        const systemStatusEl = document.getElementById('system-status');
+        let lastStatusKey = '';
+        let faultRenderPending = false;
+        let pendingFeedFaults = [];  // faults added since the last rendered frame
+        
+        function renderFaults(added, status) {
+            // Newer deltas go on top of the feed, as separate renders would have
+            pendingFeedFaults = added.concat(pendingFeedFaults);
+            
+            // Rebuild markers and feed once per frame, however many deltas landed
+            // (e.g. a buffered replay after subscribe): single layout pass
+            if (!faultRenderPending) {
+                faultRenderPending = true;
+                requestAnimationFrame(() => {
+                    faultRenderPending = false;
+                    renderFaultMarkers(Array.from(faultStore.values()));
+                    updateLiveFeed(pendingFeedFaults.splice(0));
                 });
+            }
+            
+            updateStatus(status);
+        }
+        
+        // Status rides along with each push; no extra bridge round-trip
+        function updateStatus(status) {
+            try {
+                // Last successful sheet fetch, flagged while fetches are failing
+                const fetched = status.last_update
+                    ? TIME_FMT.format(new Date(status.last_update)) : '--:--:--';
+                lastUpdateEl.textContent = status.feed_ok ? fetched : `${fetched} (LINK LOST)`;
+                lastUpdateEl.style.color = status.feed_ok ? '' : '#ff4d4d';
                 
-                // Update live feed
-                updateLiveFeed(newFaults);
+                // Count/colour only change with the tallies; skip the writes otherwise
+                const key = `${status.total_faults}:${status.critical}:${status.warnings}`;
+                if (key === lastStatusKey) return;
+                lastStatusKey = key;
                 
-                // Update status
-                const status = await window.pywebview.api.get_system_status();
-                document.getElementById('fault-count').textContent = status.total_faults;
-                document.getElementById('last-update').textContent = new Date().toLocaleTimeString();
+                faultCountEl.textContent = status.total_faults;
                 
                 if (status.critical > 0) {
-                    document.getElementById('system-status').textContent = 'CRITICAL';
-                    document.getElementById('system-status').style.color = '#ff4d4d';
+                    systemStatusEl.textContent = 'CRITICAL';
+                    systemStatusEl.style.color = '#ff4d4d';
                 } else if (status.warnings > 0) {
-                    document.getElementById('system-status').textContent = 'WARNING';
-                    document.getElementById('system-status').style.color = '#ffa500';
+                    systemStatusEl.textContent = 'WARNING';
+                    systemStatusEl.style.color = '#ffa500';
                 } else {
-                    document.getElementById('system-status').textContent = 'ONLINE';
-                    document.getElementById('system-status').style.color = '#00ff41';
+                    systemStatusEl.textContent = 'ONLINE';
+                    systemStatusEl.style.color = '#00ff41';
                 }
                 
             } catch (error) {
-                console.error('❌ Fault update error:', error);
+                console.error('❌ Status update error:', error);
             }
         }
         
+        // ===== SYNC FAULT MARKERS =====
+        function renderFaultMarkers(faults) {
+            // Diff against live markers: only new, changed or vanished ids touch the map
+            const seenThisTick = new Set();
+            
+            faults.forEach(fault => {
+                seenThisTick.add(fault.key);
+                let marker = faultMarkerById.get(fault.key);
+                
+                if (!marker) {
+                    marker = L.marker([fault.y, fault.x], {icon: faultIcon(fault.severity)});
+                    marker.bindPopup(faultPopup(fault));
+                    faultLayer.addLayer(marker);
+                    faultMarkerById.set(fault.key, marker);
+                } else if (marker.fault !== fault) {
+                    const pos = marker.getLatLng();
+                    if (pos.lat !== fault.y || pos.lng !== fault.x) {
+                        marker.setLatLng([fault.y, fault.x]);
+                    }
+                    if (marker.fault.severity !== fault.severity) {
+                        marker.setIcon(faultIcon(fault.severity));
+                    }
+                    marker.setPopupContent(faultPopup(fault));
+                }
+                marker.fault = fault;
+            });
+            
+            // Remove markers whose fault is gone (simulated ones expire on their own timer)
+            faultMarkerById.forEach((marker, id) => {
+                if (!seenThisTick.has(id)) {
+                    faultLayer.removeLayer(marker);
+                    faultMarkerById.delete(id);
+                }
+            });
+        }
+        
+        function faultIcon(severity) {
+            const color = SEV_COLOR[severity] || DEFAULT_COLOR;
+            
+            return L.divIcon({
+                html: `<div class="fault-marker" style="background: ${color}; box-shadow: 0 0 20px ${color};"></div>`,
+                className: '',
+                iconSize: [24, 24],
+                iconAnchor: [12, 12]
+            });
+        }
+        
+        function faultPopup(fault) {
+            const popup = fillTemplate(faultPopupTpl, {
+                'popup-title': `${fault.severity} FAULT`,
+                'pop-id': fault.id,
+                'pop-device': fault.device,
+                'pop-distance': fault.distance,
+                'pop-status': fault.status,
+                'pop-time': fault.time,
+                'popup-coord': `Coord: (${Math.round(fault.x)}, ${Math.round(fault.y)})`
+            });
+            popup.style.setProperty('--sev-color', SEV_COLOR[fault.severity] || DEFAULT_COLOR);
+            return popup;
+        }
+        
         // ===== UPDATE LIVE FEED PANEL =====
         function updateLiveFeed(faults) {
-            const feed = document.getElementById('live-feed');
+            const entries = [];
             
-            // Only add new faults to feed (check if already displayed)
-            const existingIds = Array.from(feed.querySelectorAll('.feed-item-id'))
-                .map(el => el.textContent);
-            
-            faults.reverse().forEach(fault => {
-                if (!existingIds.includes(fault.id)) {
-                    const item = document.createElement('div');
-                    item.className = `feed-item ${fault.severity.toLowerCase()}`;
-                    item.innerHTML = `
-                        <div class="feed-item-id">${fault.id}</div>
-                        <div>Severity: ${fault.severity}</div>
-                        <div>Device: ${fault.device}</div>
-                        <div class="feed-item-coord">X: ${Math.round(fault.x)}, Y: ${Math.round(fault.y)}</div>
-                        <div>Distance: ${fault.distance} m</div>
-                        <div>Status: ${fault.status}</div>
-                        <div style="color: #666; margin-top: 5px; font-size: 10px;">${fault.time}</div>
-                    `;
-                    feed.insertBefore(item, feed.firstChild);
-                    
-                    // Keep feed limited to 50 items
-                    if (feed.children.length > 50) {
-                        feed.removeChild(feed.lastChild);
+            faults.forEach(fault => {
+                // Only add new faults to feed (check if already displayed)
+                if (seenFaultIds.has(fault.key)) return;
+                seenFaultIds.add(fault.key);
+                
+                entries.push({
+                    id: fault.key,
+                    tpl: feedTpl,
+                    cls: fault.severity.toLowerCase(),
+                    fields: {
+                        'feed-item-id': fault.id,
+                        'feed-sev': fault.severity,
+                        'feed-device': fault.device,
+                        'feed-item-coord': `X: ${Math.round(fault.x)}, Y: ${Math.round(fault.y)}`,
+                        'feed-distance': fault.distance,
+                        'feed-status': fault.status,
+                        'feed-item-time': fault.time
                     }
+                });
+            });
+            
+            if (entries.length) pushFeedEntries(entries);
+        }
+        
+        // Prepend entries (newest first) and keep feed limited to 50 items
+        function pushFeedEntries(entries) {
+            feedData = entries.concat(feedData);
+            feedData.splice(FEED_MAX).forEach(entry => seenFaultIds.delete(entry.id));
+            renderFeedWindow();
+        }
+        
+        // ===== VIRTUALIZED FEED WINDOW =====
+        // Only entries near the scroll viewport are in the DOM; the spacer
+        // keeps the full scroll height and the window is offset into place
+        function renderFeedWindow() {
+            const top = feedEl.scrollTop - FEED_OVERSCAN;
+            const bottom = feedEl.scrollTop + feedEl.clientHeight + FEED_OVERSCAN;
+            const visible = [];
+            let y = 0, offset = 0;
+            
+            feedData.forEach(entry => {
+                const h = feedItemHeight.get(entry.tpl) || FEED_EST_HEIGHT;
+                if (y + h >= top && y <= bottom) {
+                    if (!visible.length) offset = y;
+                    visible.push(entry);
+                }
+                y += h + FEED_GAP;
+            });
+            
+            feedSpacer.style.height = `${Math.max(0, y - FEED_GAP)}px`;
+            feedWindow.style.transform = `translateY(${offset}px)`;
+            
+            // Reuse each entry's node; only insert/remove what changed so
+            // items that stay in view don't replay their slide-in
+            const nodes = visible.map(entry => entry.node || (entry.node = buildFeedItem(entry)));
+            const keep = new Set(nodes);
+            Array.from(feedWindow.children).forEach(child => {
+                if (!keep.has(child)) feedWindow.removeChild(child);
+            });
+            nodes.forEach((node, i) => {
+                const ref = feedWindow.children[i] || null;
+                if (ref !== node) feedWindow.insertBefore(node, ref);
+            });
+            
+            // Measure each item kind once; re-layout if an estimate was off
+            let measured = false;
+            visible.forEach(entry => {
+                if (!feedItemHeight.has(entry.tpl)) {
+                    feedItemHeight.set(entry.tpl, entry.node.offsetHeight);
+                    measured = true;
                 }
             });
+            if (measured) renderFeedWindow();
+        }
+        
+        function buildFeedItem(entry) {
+            const item = fillTemplate(entry.tpl, entry.fields);
+            if (entry.cls) item.classList.add(entry.cls);
+            return item;
+        }
+        
+        function scheduleFeedRender() {
+            if (feedRenderPending) return;
+            feedRenderPending = true;
+            requestAnimationFrame(() => {
+                feedRenderPending = false;
+                renderFeedWindow();
+            });
+        }
+        
+        // Clone a feed/popup template and fill its fields (no HTML parsing)
+        function fillTemplate(tpl, fields) {
+            const item = tpl.content.firstElementChild.cloneNode(true);
+            Object.entries(fields).forEach(([cls, value]) => {
+                item.querySelector('.' + cls).textContent = value;
+            });
+            return item;
+        }
+        
+        function removeSimMarker(id) {
+            const sim = simMarkerById.get(id);
+            if (!sim) return;
+            
+            clearTimeout(sim.timer);
+            faultLayer.removeLayer(sim.marker);
+            simMarkerById.delete(id);
         }
         
         // ===== INJECT SIMULATED FAULT =====
@@ -1078,66 +1739,57 @@ HTML = """<!DOCTYPE html>
                 console.log('✓ Simulated fault injected:', result);
                 
                 // Add to live feed immediately
-                const feed = document.getElementById('live-feed');
-                const item = document.createElement('div');
-                item.className = `feed-item ${result.severity.toLowerCase()}`;
-                item.innerHTML = `
-                    <div class="feed-item-id">${result.id}</div>
-                    <div>Severity: ${result.severity}</div>
-                    <div>Bus: ${result.device}</div>
-                    <div>Fault Type: ${result.fault_type}</div>
-                    <div>Current: ${result.fault_current} A</div>
-                    <div>Impedance: ${result.impedance} PU</div>
-                    <div>Voltage Drop: ${result.voltage_drop}%</div>
-                    <div class="feed-item-coord">X: ${Math.round(result.x)}, Y: ${Math.round(result.y)}</div>
-                    <div style="color: #666; margin-top: 5px; font-size: 10px;">${result.time}</div>
-                `;
-                feed.insertBefore(item, feed.firstChild);
+                pushFeedEntries([{
+                    tpl: simFeedTpl,
+                    cls: result.severity.toLowerCase(),
+                    fields: {
+                        'feed-item-id': result.id,
+                        'feed-sev': result.severity,
+                        'feed-device': result.device,
+                        'feed-fault-type': result.fault_type,
+                        'feed-current': result.fault_current,
+                        'feed-impedance': result.impedance,
+                        'feed-vdrop': result.voltage_drop,
+                        'feed-item-coord': `X: ${Math.round(result.x)}, Y: ${Math.round(result.y)}`,
+                        'feed-item-time': result.time
+                    }
+                }]);
                 
-                // Add marker to map
-                const color = result.severity === 'CRITICAL' ? '#ff4d4d' :
-                             result.severity === 'WARNING' ? '#ffa500' : '#66fcf1';
+                // Add marker to map; simulated faults never enter faultStore, so
+                // they live in their own pool for a fixed time, and re-injecting
+                // the same id (same bus, same second) replaces the old marker
+                const color = SEV_COLOR[result.severity] || DEFAULT_COLOR;
                 
-                const icon = L.divIcon({
-                    html: `<div style="
-                        width: 24px;
-                        height: 24px;
-                        background: ${color};
-                        border: 3px solid #fff;
-                        border-radius: 50%;
-                        box-shadow: 0 0 20px ${color};
-                        animation: pulse 1.5s ease-in-out infinite;
-                    "></div>`,
-                    className: '',
-                    iconSize: [24, 24],
-                    iconAnchor: [12, 12]
+                removeSimMarker(result.id);
+                const marker = L.marker([result.y, result.x], {icon: faultIcon(result.severity)});
+                faultLayer.addLayer(marker);
+                simMarkerById.set(result.id, {
+                    marker: marker,
+                    timer: setTimeout(() => removeSimMarker(result.id), SIM_MARKER_MS)
                 });
                 
-                const marker = L.marker([result.y, result.x], {
-                    icon: icon,
-                    isFault: true
-                }).addTo(map);
-                
-                marker.bindPopup(`
-                    <div style="padding: 10px;">
-                        <div style="font-size: 14px; font-weight: bold; margin-bottom: 8px; color: ${color};">
-                            SIMULATED ${result.severity} FAULT
-                        </div>
-                        <div style="line-height: 1.8;">
-                            <div>ID: ${result.id}</div>
-                            <div>Bus: ${result.device}</div>
-                            <div>Type: ${result.fault_type}</div>
-                            <div>Current: ${result.fault_current} A</div>
-                            <div>Impedance: ${result.impedance} PU</div>
-                            <div>V-Drop: ${result.voltage_drop}%</div>
-                        </div>
-                    </div>
-                `);
-                
-                markers.push(marker);
+                const popup = fillTemplate(simPopupTpl, {
+                    'popup-title': `SIMULATED ${result.severity} FAULT`,
+                    'pop-id': result.id,
+                    'pop-device': result.device,
+                    'pop-fault-type': result.fault_type,
+                    'pop-current': result.fault_current,
+                    'pop-impedance': result.impedance,
+                    'pop-vdrop': result.voltage_drop
+                });
+                popup.style.setProperty('--sev-color', color);
+                marker.bindPopup(popup);
                 
-                // Zoom to fault
-                map.setView([result.y, result.x], 0);
+                // Move to fault after the feed/marker DOM work, in one frame;
+                // keep the zoom unless the fault is off-screen
+                const target = [result.y, result.x];
+                requestAnimationFrame(() => {
+                    if (map.getBounds().contains(target)) {
+                        map.panTo(target, {animate: false});
+                    } else {
+                        map.setView(target, 0, {animate: false});
+                    }
+                });
                 
             } catch (error) {
                 console.error('❌ Fault injection error:', error);
@@ -1164,20 +1816,37 @@ HTML = """<!DOCTYPE html>
         }
         
         // ===== INITIALIZATION =====
+        // Leaflet is deferred: it runs after this script but before DOMContentLoaded.
+        // readyState is already 'interactive' in between, so track the event itself
+        const domReady = new Promise(resolve =>
+            document.addEventListener('DOMContentLoaded', resolve, {once: true}));
+        
         window.addEventListener('pywebviewready', async function() {
             console.log('✓ PyWebView ready');
             
+            await domReady;
+            
+            renderFeedWindow();
+            feedEl.addEventListener('scroll', scheduleFeedRender, {passive: true});
+            window.addEventListener('resize', scheduleFeedRender);
+            
+            // Heights measured with the fallback font are off once Share Tech Mono swaps in
+            if (document.fonts) {
+                document.fonts.ready.then(() => {
+                    feedItemHeight.clear();
+                    scheduleFeedRender();
+                });
+            }
+            
             initMap();
             await drawTopology();
             await populateBusDropdown();
             
-            // Initial data fetch
-            await updateFaults();
-            
-            // Start real-time updates (every 1 second)
-            updateInterval = setInterval(updateFaults, 1000);
+            // Initial snapshot, then Python pushes deltas as faults change
+            await syncSubscription();
+            document.addEventListener('visibilitychange', syncSubscription);
             
-            console.log('✓ System fully initialized - Auto-refresh active');
+            console.log('✓ System fully initialized - Live push active');
         });
     </script>
 </body>
@@ -21,9 +21,14 @@ TELEGRAM_BOT_TOKEN = "7853460988:AAH3eIhrYLcu9gmVzVu2Xq-hAgs1pUJk-wU"  # Replace
 TELEGRAM_CHAT_IDS = ["6493927838"]  # Replace with your chat ID from @userinfobot
 
 
+# Fault severity -> get_stats counter name
+SEVERITY_KEYS = {"CRITICAL": "crit", "WARNING": "warn", "CAUTION": "caution", "INFO": "info"}
+
+
 class Api:
     def __init__(self):
         self.cache = []
+        self.stats = {}  # tallied in get_faults alongside the cache
         self.gc = None
         self.worksheet = None
         self.telegram_enabled = False
@@ -137,6 +142,9 @@ class Api:
             reader = csv.reader(io.StringIO(response.text))
             next(reader)  # Skip header
             data = []
+            stats = self._empty_stats()
+            today = datetime.now().date()
+            week_ago = today - timedelta(days=7)
 
             existing_ids = {f['id'] for f in self.cache}
 
@@ -170,6 +178,7 @@ class Api:
                         "sev": sev
                     }
                     data.append(fault)
+                    self._tally_fault(stats, fault, today, week_ago)
                     
                     # 🔔 AUTO TELEGRAM ALERT LOGIC
                     # Send alert ONLY for NEW faults (not in existing_ids)
@@ -188,7 +197,9 @@ class Api:
                     print(f"⚠ Error processing row: {e}")
                     continue
                     
+            stats["total"] = len(data)
             self.cache = data
+            self.stats = stats
             return data
             
         except Exception as e:
@@ -214,15 +225,15 @@ class Api:
             return {"ok": False, "err": str(e)}
 
     def get_stats(self):
-        """Generate statistics from cached fault data"""
+        """Return statistics tallied from the cached fault data (no rescan)"""
         if not self.cache:
             return {}
-            
-        today = datetime.now().date()
-        week_ago = today - timedelta(days=7)
-        
-        stats = {
-            "total": len(self.cache),
+        return self.stats
+    
+    @staticmethod
+    def _empty_stats():
+        return {
+            "total": 0,
             "today": 0,
             "week": 0,
             "ack": 0,
@@ -233,26 +244,25 @@ class Api:
             "caution": 0,  # ← ADD THIS
             "devs": {}
         }
-        
-        for f in self.cache:
-            try:
-                fd = datetime.strptime(f["date"], "%Y-%m-%d").date()
-                
-                if fd == today:
-                    stats["today"] += 1
-                if fd >= week_ago:
-                    stats["week"] += 1
-                    
-                stats["ack" if f["ack"] else "pend"] += 1
-                
-                severity_map = {"CRITICAL": "crit", "WARNING": "warn", "CAUTION": "caution", "INFO": "info"}
-                stats[severity_map[f["sev"]]] += 1
-                
-                stats["devs"][f["device"]] = stats["devs"].get(f["device"], 0) + 1
-            except:
-                pass
+    
+    @staticmethod
+    def _tally_fault(stats, f, today, week_ago):
+        """Count one fault into stats (rows with a bad date are skipped, as before)"""
+        try:
+            fd = datetime.strptime(f["date"], "%Y-%m-%d").date()
+            
+            if fd == today:
+                stats["today"] += 1
+            if fd >= week_ago:
+                stats["week"] += 1
                 
-        return stats
+            stats["ack" if f["ack"] else "pend"] += 1
+            
+            stats[SEVERITY_KEYS[f["sev"]]] += 1
+            
+            stats["devs"][f["device"]] = stats["devs"].get(f["device"], 0) + 1
+        except:
+            pass
     
     def get_telegram_status(self):
         """Get telegram configuration status for UI"""